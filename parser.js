@@ -0,0 +1,114 @@
+// 売上ファイルの解析処理
+// 画面側では <script> として読み込み、Web Worker としても同じファイルを起動する。
+// Worker で動かすと重い解析中も画面（スピナー）が止まらない。
+
+const XLSX_URL = 'https://cdn.sheetjs.com/xlsx-0.20.3/package/dist/xlsx.full.min.js';
+
+// 売上データの列位置（先頭列からの位置）
+const COL = {
+    DATE: 0,
+    CUST1: 1,
+    CUST2: 2,
+    NAME: 6,
+    QTY: 7,
+    AMOUNT: 10
+};
+
+// 売上データは行オブジェクトではなく列ごとの型付き配列で持つ（日付・塾名・商品名は辞書の番号）
+const createColumns = (length) => ({
+    length,
+    date: new Int32Array(length),
+    cust: new Int32Array(length),
+    item: new Int32Array(length),
+    qty: new Float64Array(length),
+    amount: new Float64Array(length)
+});
+
+const sliceColumns = (cols, length) => ({
+    length,
+    date: cols.date.slice(0, length),
+    cust: cols.cust.slice(0, length),
+    item: cols.item.slice(0, length),
+    qty: cols.qty.slice(0, length),
+    amount: cols.amount.slice(0, length)
+});
+
+const formatDate = (val) => {
+    if (!val) return '';
+    if (val instanceof Date) {
+        return `${val.getFullYear()}/${val.getMonth()+1}/${val.getDate()}`;
+    }
+    return String(val);
+};
+
+// ファイルの中身（ArrayBuffer）から列データと辞書を作る
+const parseWorkbook = (buffer) => {
+    const data = new Uint8Array(buffer);
+    // 使うのは先頭シートの値だけなので、書式文字列・HTML・数式の生成を省いて解析する
+    const workbook = XLSX.read(data, {
+        type: 'array',
+        cellDates: true,
+        dense: true,
+        sheets: 0,
+        cellText: false,
+        cellHTML: false,
+        cellFormula: false
+    });
+    const sheetName = workbook.SheetNames[0];
+    const sheet = workbook.Sheets[sheetName];
+    // 金額列より右は使わないので読み込まない
+    let range;
+    if (sheet['!ref']) {
+        range = XLSX.utils.decode_range(sheet['!ref']);
+        range.e.c = Math.min(range.e.c, range.s.c + COL.AMOUNT);
+    }
+    const json = XLSX.utils.sheet_to_json(sheet, { header: 1, defval: '', range });
+
+    // 日付・塾名・商品名は辞書化し、行には番号だけ持たせる（出現順に採番）
+    const dict = { dates: [], custs: [], names: [] };
+    const dateIds = new Map();
+    const custIds = new Map();
+    const nameIds = new Map();
+    const encode = (ids, list, value) => {
+        let id = ids.get(value);
+        if (id === undefined) {
+            id = list.length;
+            list.push(value);
+            ids.set(value, id);
+        }
+        return id;
+    };
+
+    const cols = createColumns(Math.max(json.length - 1, 0));
+    let count = 0;
+    for (let i = 1; i < json.length; i++) {
+        const row = json[i];
+        const qty = Number(row[COL.QTY] || 0);
+        if (qty !== 0) {
+            cols.date[count] = encode(dateIds, dict.dates, formatDate(row[COL.DATE]));
+            cols.cust[count] = encode(custIds, dict.custs, String(row[COL.CUST1] || '') + String(row[COL.CUST2] || ''));
+            cols.item[count] = encode(nameIds, dict.names, String(row[COL.NAME] || ''));
+            cols.qty[count] = qty;
+            cols.amount[count] = Number(row[COL.AMOUNT] || 0);
+            count++;
+        }
+    }
+
+    return { rows: sliceColumns(cols, count), dict };
+};
+
+// Worker として起動された場合：受け取ったファイルを解析して結果を返す
+if (typeof importScripts === 'function' && typeof document === 'undefined') {
+    importScripts(XLSX_URL);
+
+    self.onmessage = (e) => {
+        try {
+            const result = parseWorkbook(e.data);
+            const { rows } = result;
+            // 列データはコピーせずに画面側へ引き渡す
+            self.postMessage(result, [rows.date, rows.cust, rows.item, rows.qty, rows.amount].map(col => col.buffer));
+        } catch (err) {
+            self.postMessage({ error: String(err && err.message || err) });
+        }
+    };
+}
@@ -1,8 +1,9 @@
-const CACHE_NAME = 'sales-app-v1';
+const CACHE_NAME = 'sales-app-v2';
 const ASSETS = [
     './',
     './index.html',
     './manifest.json',
+    './parser.js',
     'https://cdn.sheetjs.com/xlsx-0.20.3/package/dist/xlsx.full.min.js'
 ];
 
@@ -12,6 +13,14 @@ self.addEventListener('install', (e) => {
     );
 });
 
+self.addEventListener('activate', (e) => {
+    e.waitUntil(
+        caches.keys().then((keys) => Promise.all(
+            keys.filter((key) => key !== CACHE_NAME).map((key) => caches.delete(key))
+        ))
+    );
+});
+
 self.addEventListener('fetch', (e) => {
     e.respondWith(
         caches.match(e.request).then((response) => response || fetch(e.request))